@@ -4,14 +4,28 @@ Garmin Connect Log API
 Flask app to fetch and analyze Garmin Connect health data for ME/CFS PEM threshold research
 """
 
+import bisect
+import functools
+import glob
+import gzip
+import itertools
 import json
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
 
 from dotenv import load_dotenv
-from flask import Flask, jsonify, request
+from flask import Flask, jsonify, render_template, request
 from garminconnect import Garmin
 from tqdm import tqdm
+from werkzeug.http import generate_etag
+
+try:
+    from compression import zstd
+except ImportError:  # compression.zstd is only present when CPython is built with libzstd
+    zstd = None
 
 # Load environment variables
 load_dotenv()
@@ -24,10 +38,27 @@ CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
 GARMIN_SESSION = os.getenv("GARMIN_SESSION")
 GARMIN_NAME = os.getenv("GARMIN_NAME")
 HR_PROFILE_OVERRIDES_PATH = os.getenv("HR_PROFILE_OVERRIDES_PATH")
+MAX_WORKERS = 8  # Concurrent Garmin requests (keep low to respect rate limits)
+REFRESH_RECENT_DAYS = 2  # Today and yesterday are always refetched
+ACTIVITY_PAGE_SIZE = 500  # Activities per request when paging the activity list
+RESPONSE_CACHE_TTL = 900  # Seconds to serve /api/summary and /api/activities from memory
+RESPONSE_CACHE_SIZE = 32
+OUTPUT_FORMATS = {"human", "raw"}  # Values accepted by the format parameter
+CACHE_FSYNC = os.getenv("CACHE_FSYNC", "").lower() in {"1", "true", "yes"}
+STALE_CACHE_TMP_AGE = 600  # Seconds before a cache temp file counts as abandoned (gunicorn timeout in gunicorn_conf.py)
 
 # Ensure cache directory exists
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+# Shared Garmin client, created lazily by get_garmin_client()
+_garmin_client = None
+_garmin_client_lock = threading.Lock()
+
+# Encoded API and status page responses keyed by endpoint and parameters, as (created, body, encoded) tuples,
+# where encoded maps a content encoding to its (compressed body, ETag)
+_response_cache = {}
+_response_cache_lock = threading.Lock()
+
 GARMIN_ZONE_RANGES = [
     {"label": "Zone 5", "min_percent": 90, "max_percent": 100},
     {"label": "Zone 4", "min_percent": 80, "max_percent": 89},
@@ -44,6 +75,17 @@ OLYMPIATOPPEN_ZONE_RANGES = [
     {"label": "I-1", "min_percent": 55, "max_percent": 71},
 ]
 
+# Output keys for each zone number, e.g. {5: "Zone 5 (Garmin)"} (zone ranges are ordered 5 to 1)
+GARMIN_ZONE_KEYS = {5 - i: f"{zone['label']} (Garmin)" for i, zone in enumerate(GARMIN_ZONE_RANGES)}
+OLYMPIATOPPEN_ZONE_KEYS = {5 - i: f"{zone['label']} (Olympiatoppen)" for i, zone in enumerate(OLYMPIATOPPEN_ZONE_RANGES)}
+
+# Zone context for activities without an HR profile override (shared, do not mutate)
+DEFAULT_HR_ZONE_CONTEXT = {
+    "zone_scheme": "garmin",
+    "max_hr": None,
+    "device": None,
+}
+
 
 def parse_date_or_none(date_str, field_name):
     """Parse a YYYY-MM-DD string to a date or return None."""
@@ -93,57 +135,54 @@ def load_hr_profile_overrides():
             }
         )
 
+    # Keep overrides sorted by start date so get_hr_zone_context can binary-search them
+    overrides.sort(key=override_start)
     validate_hr_profile_overlaps(overrides)
     return overrides
 
 
+def override_start(override):
+    """Sort key for HR profile overrides; an open start sorts first."""
+    return override["start_date"] or date.min
+
+
 def validate_hr_profile_overlaps(overrides):
     """Validate that HR profile override ranges do not overlap."""
     if not overrides:
         return
 
-    def range_bounds(item):
-        start = item["start_date"] or datetime.min.date()
-        end = item["end_date"] or datetime.max.date()
-        return start, end
-
-    for idx, current in enumerate(overrides):
-        current_start, current_end = range_bounds(current)
-        for other in overrides[idx + 1 :]:
-            other_start, other_end = range_bounds(other)
-            overlaps = current_start <= other_end and other_start <= current_end
-            if overlaps:
-                raise ValueError(
-                    "Overlapping HR profile overrides detected between "
-                    f"{current.get('start_date')}–{current.get('end_date')} and "
-                    f"{other.get('start_date')}–{other.get('end_date')}"
-                )
+    # After sorting by start date, any overlap shows up between neighbours
+    ordered = sorted(overrides, key=override_start)
+    for current, other in itertools.pairwise(ordered):
+        current_end = current["end_date"] or date.max
+        if override_start(other) <= current_end:
+            raise ValueError(
+                "Overlapping HR profile overrides detected between "
+                f"{current.get('start_date')}–{current.get('end_date')} and "
+                f"{other.get('start_date')}–{other.get('end_date')}"
+            )
 
 
 def get_hr_zone_context(activity_date, overrides):
-    """Get HR zone context for the activity date, using overrides or default Garmin zones."""
+    """Get HR zone context for the activity date, using overrides or default Garmin zones.
+
+    Overrides must be sorted by start date and non-overlapping, as returned by load_hr_profile_overrides.
+    """
     if activity_date is None:
-        return {
-            "zone_scheme": "garmin",
-            "max_hr": None,
-            "device": None,
-        }
+        return DEFAULT_HR_ZONE_CONTEXT
 
-    selected = None
-    for override in overrides:
-        start = override["start_date"]
-        end = override["end_date"]
-        if start and activity_date < start:
-            continue
-        if end and activity_date > end:
-            continue
-        selected = override
-        break
+    # The only candidate is the last override starting on or before the activity date
+    idx = bisect.bisect_right(overrides, activity_date, key=override_start) - 1
+    if idx < 0:
+        return DEFAULT_HR_ZONE_CONTEXT
+    selected = overrides[idx]
+    if selected["end_date"] and activity_date > selected["end_date"]:
+        return DEFAULT_HR_ZONE_CONTEXT
 
     return {
-        "zone_scheme": (selected or {}).get("zone_scheme", "garmin"),
-        "max_hr": (selected or {}).get("max_hr"),
-        "device": (selected or {}).get("device"),
+        "zone_scheme": selected.get("zone_scheme", "garmin"),
+        "max_hr": selected.get("max_hr"),
+        "device": selected.get("device"),
     }
 
 
@@ -152,17 +191,14 @@ def format_hr_zones_with_labels(zones, zone_scheme):
     if not zones:
         return None
 
-    scheme_name = "Olympiatoppen" if zone_scheme == "olympiatoppen" else "Garmin"
-    zone_ranges = OLYMPIATOPPEN_ZONE_RANGES if zone_scheme == "olympiatoppen" else GARMIN_ZONE_RANGES
+    zone_keys = OLYMPIATOPPEN_ZONE_KEYS if zone_scheme == "olympiatoppen" else GARMIN_ZONE_KEYS
 
     formatted_zones = []
     for zone_data in zones:
         zone_num = zone_data["zone"]
-        # Find the matching zone label (zone_ranges are ordered 5 to 1)
-        zone_label = zone_ranges[5 - zone_num]["label"]
         formatted_zones.append(
             {
-                f"{zone_label} ({scheme_name})": zone_num,
+                zone_keys[zone_num]: zone_num,
                 "time_seconds": zone_data["time_seconds"],
             }
         )
@@ -170,66 +206,124 @@ def format_hr_zones_with_labels(zones, zone_scheme):
     return formatted_zones
 
 
-def get_cache_filename(data_type, months):
-    """Get cache filename for specified data type and months."""
-    return os.path.join(CACHE_DIR, f"{data_type}-last-{months}-months.json")
+def get_cache_filename(data_type, date_str):
+    """Get cache filename for specified data type and date."""
+    return os.path.join(CACHE_DIR, data_type, f"{date_str}.json")
 
 
-def load_cache(data_type, months):
-    """Load cached data from JSON file."""
-    cache_file = get_cache_filename(data_type, months)
-    if os.path.exists(cache_file):
+def load_cache(data_type, dates):
+    """Load cached per-day data from JSON files, keyed by date. Dates without a cache file are omitted."""
+    cached = {}
+    for date_str in dates:
+        cache_file = get_cache_filename(data_type, date_str)
         try:
-            with open(cache_file) as f:
-                return json.load(f)
+            # Open directly rather than checking os.path.exists first, saving a stat per day
+            with open(cache_file, "rb") as f:
+                cached[date_str] = json.loads(f.read())
+        except FileNotFoundError:
+            continue
         except Exception as e:
             print(f"Warning: Failed to load cache from {cache_file}: {e}")
-    return None
+    return cached
 
 
-def save_cache(data_type, months, data):
-    """Save data to JSON cache file."""
-    cache_file = get_cache_filename(data_type, months)
-    try:
-        with open(cache_file, "w") as f:
-            json.dump(data, f, indent=2)
-    except Exception as e:
-        print(f"Warning: Failed to save cache to {cache_file}: {e}")
+def save_cache(data_type, data_by_date, cached=None):
+    """Save per-day data to JSON cache files.
 
+    Days whose data equals their entry in cached (as returned by load_cache) are skipped, so refetching recent days
+    that have not changed does not rewrite their files.
+    """
+    os.makedirs(os.path.join(CACHE_DIR, data_type), exist_ok=True)
+    cached = cached or {}
+    for date_str, data in data_by_date.items():
+        if date_str in cached and cached[date_str] == data:
+            continue
+        cache_file = get_cache_filename(data_type, date_str)
+        try:
+            # Write to a temp file and rename it into place so readers never see a partial file
+            tmp_file = f"{cache_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_file, "w") as f:
+                # Compact encoding in a single write; json.dump would issue one write per token
+                f.write(json.dumps(data, separators=(",", ":")))
+                if CACHE_FSYNC:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, cache_file)
+        except Exception as e:
+            print(f"Warning: Failed to save cache to {cache_file}: {e}")
 
-def get_garmin_client():
+
+def remove_stale_cache_files():
+    """Remove temp files left behind by cache writes that were interrupted.
+
+    Runs in every worker process at startup, so only files older than STALE_CACHE_TMP_AGE are removed; newer ones
+    may belong to a write still in progress in another worker.
+    """
+    cutoff = time.time() - STALE_CACHE_TMP_AGE
+    for tmp_file in glob.glob(os.path.join(CACHE_DIR, "*", "*.tmp")):
+        try:
+            if os.path.getmtime(tmp_file) < cutoff:
+                os.remove(tmp_file)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            print(f"Warning: Failed to remove stale cache file {tmp_file}: {e}")
+
+
+def get_all_dates(start_date, end_date):
+    """Get all dates in range as YYYY-MM-DD strings, newest first."""
+    return [date.fromordinal(ordinal).isoformat() for ordinal in range(end_date.toordinal(), start_date.toordinal() - 1, -1)]
+
+
+def get_dates_to_fetch(all_dates, cached):
+    """Get dates missing from cache plus the most recent days, which may still be incomplete."""
+    recent = set(all_dates[:REFRESH_RECENT_DAYS])
+    return [date_str for date_str in all_dates if date_str not in cached or date_str in recent]
+
+
+def create_garmin_client():
     """Create and authenticate Garmin Connect client."""
     if not GARMIN_SESSION:
         raise Exception("GARMIN_SESSION not found in .env file. Run setup_oauth.py first.")
 
     client = Garmin()
     client.garth.loads(GARMIN_SESSION)
+    # One keep-alive connection per concurrent fetch so TLS sessions are reused
+    client.garth.configure(pool_connections=MAX_WORKERS + 1, pool_maxsize=MAX_WORKERS + 1)
 
-    # Fetch user profile to set display name (prevents 403 errors)
-    client.display_name = client.get_full_name()
-    profile = client.get_user_profile()
-
-    try:
-        client.display_name = client.get_full_name() or GARMIN_NAME
-    except Exception:
-        # Fallback to getting display name from user summary
-        try:
-            profile = client.get_user_profile()
-            client.display_name = profile.get("displayName") or profile.get("userName")
-        except Exception:
-            pass
+    # Fetch user profile once to set display name (prevents 403 errors); this also
+    # verifies the session before any data is fetched and cached
+    profile = client.get_user_profile() or {}
+    client.display_name = client.get_full_name() or GARMIN_NAME or profile.get("displayName") or profile.get("userName")
 
     return client
 
 
+def get_garmin_client():
+    """Get the shared Garmin Connect client, authenticating on first use.
+
+    garth refreshes an expired OAuth2 token in place before each request, so the client lives for the whole process.
+    """
+    global _garmin_client
+    if _garmin_client is None:
+        with _garmin_client_lock:
+            if _garmin_client is None:
+                _garmin_client = create_garmin_client()
+    return _garmin_client
+
+
 def format_duration(seconds):
     """Format duration in seconds to human-readable format (HHh MMm SSs)."""
     if seconds is None:
         return None
-    seconds = int(seconds)  # Convert to int in case it's a float
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    return _format_whole_duration(int(seconds))  # Convert to int in case it's a float
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_duration(seconds):
+    """Format whole seconds as HHh MMm SSs, memoized since rounded durations repeat across activities."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
     return f"{hours:01d}h {minutes:02d}m {secs:02d}s"
 
 
@@ -237,18 +331,44 @@ def format_sleep_duration(seconds):
     """Format sleep duration without leading zero for hours."""
     if seconds is None:
         return None
-    seconds = int(seconds)
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
+    return _format_sleep_minutes(int(seconds) // 60)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_sleep_minutes(minutes):
+    """Format whole minutes as Hh MMm, memoized since sleep durations fall on a small set of minute values."""
+    hours, minutes = divmod(minutes, 60)
     return f"{hours}h {minutes:02d}m"
 
 
 HR_PROFILE_OVERRIDES = load_hr_profile_overrides()
+remove_stale_cache_files()
 
 
-def fetch_daily_summary(client, date_str):
-    """Fetch daily health summary for a specific date."""
-    summary = {
+@functools.lru_cache(maxsize=4096)
+def _hr_zone_context_for_date(activity_date):
+    """Get the HR zone context for a date from HR_PROFILE_OVERRIDES, memoized since many activities share a date."""
+    return get_hr_zone_context(activity_date, HR_PROFILE_OVERRIDES)
+
+
+def fetch_body_battery_range(client, start_date, end_date):
+    """Fetch Body Battery values for a date range in a single request, keyed by date."""
+    try:
+        bb_data = client.get_body_battery(start_date, end_date)
+    except Exception as e:
+        print(f"  Warning: Failed to get Body Battery for {start_date} to {end_date}: {e}")
+        return {}
+
+    values_by_date = {}
+    for entry in bb_data or []:
+        if entry.get("date"):
+            values_by_date[entry["date"]] = [tup[-1] for tup in entry.get("bodyBatteryValuesArray") or []]
+    return values_by_date
+
+
+def new_daily_summary(date_str):
+    """Create an empty daily summary for a date."""
+    return {
         "date": date_str,
         "steps": None,
         "hrv_overnight_avg": None,
@@ -259,62 +379,156 @@ def fetch_daily_summary(client, date_str):
         "body_battery_values": None,
         "sleep_duration": None,
         "sleep_score": None,
-        "num_activities": 0,
     }
 
+
+def fetch_stats(client, date_str):
+    """Fetch daily stats (resting HR, max HR, steps) for a date.
+
+    Like the other per-source fetchers, returns the fields found ({} if Garmin has no data) or None if the request failed.
+    """
     try:
-        # Get daily stats (resting HR, max HR, steps)
         stats = client.get_stats(date_str)
         if stats:
-            summary["steps"] = stats.get("totalSteps")
-            summary["resting_hr"] = stats.get("restingHeartRate")
-            summary["max_hr"] = stats.get("maxHeartRate")
+            return {
+                "steps": stats.get("totalSteps"),
+                "resting_hr": stats.get("restingHeartRate"),
+                "max_hr": stats.get("maxHeartRate"),
+            }
     except Exception as e:
         print(f"  Warning: Failed to get stats for {date_str}: {e}")
+        return None
+    return {}
 
+
+def fetch_hrv(client, date_str):
+    """Fetch overnight HRV average for a date."""
     try:
-        # Get HRV data
         hrv_data = client.get_hrv_data(date_str)
         if hrv_data and "hrvSummary" in hrv_data:
-            summary["hrv_overnight_avg"] = hrv_data["hrvSummary"].get("lastNightAvg")
+            return {"hrv_overnight_avg": hrv_data["hrvSummary"].get("lastNightAvg")}
     except Exception as e:
         print(f"  Warning: Failed to get HRV for {date_str}: {e}")
+        return None
+    return {}
 
-    try:
-        # Get Body Battery hourly data
-        bb_data = client.get_body_battery(date_str)
 
-        if bb_data:
-            for entry in bb_data:
-                values = [tup[-1] for tup in entry.get("bodyBatteryValuesArray", [])]
+def summarize_body_battery(values):
+    """Build the Body Battery summary fields from hourly values."""
+    if not values:
+        return {}
+    return {
+        "body_battery_max": max(values),
+        "body_battery_min": min(values),
+        "body_battery_values": values,
+    }
 
-            if values:
-                summary["body_battery_max"] = max(values)
-                summary["body_battery_min"] = min(values)
-                summary["body_battery_values"] = values
+
+def fetch_body_battery(client, date_str):
+    """Fetch hourly Body Battery values for a single date."""
+    try:
+        bb_data = client.get_body_battery(date_str) or []
+        return summarize_body_battery([tup[-1] for entry in bb_data for tup in entry.get("bodyBatteryValuesArray") or ()])
     except Exception as e:
         print(f"  Warning: Failed to get Body Battery for {date_str}: {e}")
+        return None
+
 
+def fetch_sleep(client, date_str):
+    """Fetch sleep duration and score for a date."""
     try:
-        # Get sleep data
         sleep_data = client.get_sleep_data(date_str)
         if sleep_data and "dailySleepDTO" in sleep_data:
             sleep = sleep_data["dailySleepDTO"]
-            summary["sleep_duration"] = sleep.get("sleepTimeSeconds")
-            summary["sleep_score"] = sleep.get("sleepScores", {}).get("overall", {}).get("value")
+            return {
+                "sleep_duration": sleep.get("sleepTimeSeconds"),
+                "sleep_score": sleep.get("sleepScores", {}).get("overall", {}).get("value"),
+            }
     except Exception as e:
         print(f"  Warning: Failed to get sleep data for {date_str}: {e}")
+        return None
+    return {}
 
-    return summary
+
+def merge_daily_summary(fetched, cached):
+    """Merge a refetched daily summary over its cached copy, keeping cached values where the refetch returned None.
+
+    Each source is fetched separately, so a source that failed or returned no data leaves its fields as None; this
+    stops that from wiping out values already cached for the day.
+    """
+    if not cached:
+        return fetched
+    return {key: cached.get(key) if value is None else value for key, value in fetched.items()}
+
+
+def fetch_daily_summaries(executor, client, dates, body_battery_by_date):
+    """Fetch daily health summaries for several dates, keyed by date.
+
+    Each day's stats, HRV, Body Battery and sleep requests are submitted as separate tasks on the shared executor,
+    so a day takes as long as its slowest request rather than the sum of all four. Body Battery values already
+    fetched by fetch_body_battery_range skip that request.
+
+    Returns the summaries and the set of dates where at least one request failed; those summaries are incomplete
+    and should not be cached.
+    """
+    summaries = {date_str: new_daily_summary(date_str) for date_str in dates}
+    failed_dates = set()
+    futures = {}
+    for date_str in dates:
+        fetchers = [fetch_stats, fetch_hrv, fetch_sleep]
+        if date_str in body_battery_by_date:
+            summaries[date_str].update(summarize_body_battery(body_battery_by_date[date_str]))
+        else:
+            fetchers.append(fetch_body_battery)
+        for fetcher in fetchers:
+            futures[executor.submit(fetcher, client, date_str)] = date_str
+
+    for future in tqdm(as_completed(futures), total=len(futures), desc="Daily summaries", unit="request"):
+        result = future.result()
+        if result is None:
+            failed_dates.add(futures[future])
+        else:
+            summaries[futures[future]].update(result)
+    return summaries, failed_dates
+
+
+def fetch_daily_summary(client, date_str):
+    """Fetch the daily health summary for a single date, running its four requests in parallel.
+
+    Returns the summary and whether any of its requests failed.
+    """
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        summaries, failed_dates = fetch_daily_summaries(executor, client, [date_str], {})
+    return summaries[date_str], bool(failed_dates)
+
+
+def fetch_activity_list(client, start_date, end_date):
+    """Fetch raw activities for a date range in large pages.
+
+    garminconnect's get_activities_by_date pages 20 activities at a time; it is used as fallback.
+    """
+    try:
+        activity_list = []
+        params = {"startDate": start_date, "endDate": end_date, "start": 0, "limit": ACTIVITY_PAGE_SIZE}
+        while True:
+            page = client.connectapi(client.garmin_connect_activities, params=params) or []
+            activity_list.extend(page)
+            if len(page) < ACTIVITY_PAGE_SIZE:
+                return activity_list
+            params["start"] += ACTIVITY_PAGE_SIZE
+    except Exception as e:
+        print(f"  Warning: Failed to page activities, falling back to get_activities_by_date: {e}")
+        return client.get_activities_by_date(start_date, end_date)
 
 
 def fetch_activities(client, start_date, end_date):
     """Fetch activities for a date range."""
     activities = []
+    activity_dates = {}
 
     try:
         # Get activities in date range
-        activity_list = client.get_activities_by_date(start_date, end_date)
+        activity_list = fetch_activity_list(client, start_date, end_date)
 
         for activity in activity_list:
             # Extract HR zones from hrTimeInZone fields
@@ -324,7 +538,7 @@ def fetch_activities(client, start_date, end_date):
             for i in range(5, 0, -1):  # HR zones 5-1 inclusive
                 time_in_zone = activity.get(f"hrTimeInZone_{i}")
                 if time_in_zone is not None:
-                    zones.append({"zone": i, "time_seconds": float(f"{time_in_zone:.2f}")})
+                    zones.append({"zone": i, "time_seconds": round(time_in_zone, 2)})
 
             if zones:
                 hr_zones = zones
@@ -336,12 +550,16 @@ def fetch_activities(client, start_date, end_date):
             start_time_local = activity.get("startTimeLocal", "")
             activity_date = None
             if start_time_local:
-                try:
-                    activity_date = datetime.strptime(start_time_local[:10], "%Y-%m-%d").date()
-                except ValueError:
-                    activity_date = None
+                # Parse each day once; many activities share a date
+                day = start_time_local[:10]
+                if day not in activity_dates:
+                    try:
+                        activity_dates[day] = date.fromisoformat(day)
+                    except ValueError:
+                        activity_dates[day] = None
+                activity_date = activity_dates[day]
 
-            hr_zone_context = get_hr_zone_context(activity_date, HR_PROFILE_OVERRIDES) if activity_date else get_hr_zone_context(None, HR_PROFILE_OVERRIDES)
+            hr_zone_context = _hr_zone_context_for_date(activity_date)
 
             # Format hr_zones with scheme-specific labels
             formatted_hr_zones = format_hr_zones_with_labels(hr_zones, hr_zone_context["zone_scheme"])
@@ -361,37 +579,55 @@ def fetch_activities(client, start_date, end_date):
 
     except Exception as e:
         print(f"  Warning: Failed to get activities: {e}")
+        return None
 
     return activities
 
 
-def count_activities_by_date(activities):
-    """Count activities per date from activities list."""
-    activity_counts = {}
+def fetch_activities_by_date(client, dates):
+    """Fetch activities covering the given dates in one range request, grouped by date.
+
+    Every date in the fetched range gets an entry (possibly empty) so days without activities are cached too.
+    Activities without a start time have no day to be cached under and are left out.
+    Returns an empty dict if the request failed, so nothing is cached.
+    """
+    activities = fetch_activities(client, min(dates), max(dates))
+    if activities is None:
+        return {}
+
+    activities_by_date = {date_str: [] for date_str in dates}
+    undated = 0
     for activity in activities:
-        # Extract date from datetime string (format: "YYYY-MM-DD HH:MM:SS")
-        datetime_str = activity.get("datetime", "")
-        if datetime_str:
-            date = datetime_str.split()[0] if " " in datetime_str else datetime_str[:10]
-            activity_counts[date] = activity_counts.get(date, 0) + 1
-    return activity_counts
+        if activity["datetime"]:
+            activities_by_date.setdefault(activity["datetime"][:10], []).append(activity)
+        else:
+            undated += 1
+    if undated:
+        print(f"  Warning: Skipped {undated} activities without a start time")
+    return activities_by_date
 
 
-def format_summaries_for_output(summaries):
-    """Format summaries with human-readable durations for output."""
+def format_summaries_for_output(summaries, mutate=False):
+    """Format summaries with human-readable durations for output.
+
+    With mutate=True the summaries are formatted in place instead of copied; only use it for data that is discarded after the response.
+    """
     formatted = []
     for summary in summaries:
-        formatted_summary = summary.copy()
+        formatted_summary = summary if mutate else summary.copy()
         formatted_summary["sleep_duration"] = format_sleep_duration(summary.get("sleep_duration"))
         formatted.append(formatted_summary)
     return formatted
 
 
-def format_activities_for_output(activities):
-    """Format activities with human-readable durations and distances for output."""
+def format_activities_for_output(activities, mutate=False):
+    """Format activities with human-readable durations and distances for output.
+
+    With mutate=True the activities are formatted in place instead of copied; only use it for data that is discarded after the response.
+    """
     formatted = []
     for activity in activities:
-        formatted_activity = activity.copy()
+        formatted_activity = activity if mutate else activity.copy()
         formatted_activity["duration"] = format_duration(activity.get("duration"))
         if activity.get("distance") is not None:
             formatted_activity["distance"] = f"{activity['distance'] / 1000:.2f}km"
@@ -399,6 +635,108 @@ def format_activities_for_output(activities):
     return formatted
 
 
+def paginate(rows, key, cursor, limit):
+    """Apply keyset pagination to newest-first rows, returning the page and the cursor for the next one.
+
+    Keys need not be unique: when a page ends partway through rows sharing a key, the cursor becomes "<key>#<n>",
+    meaning skip the first n rows with that key, so no row is skipped or repeated across the page boundary.
+    """
+    skip = 0
+    if cursor and "#" in cursor:
+        cursor, _, skip = cursor.partition("#")
+        skip = int(skip) if skip.isdigit() else 0
+        # Rows with the cursor key come first among the remaining newest-first rows
+        rows = [row for row in rows if row[key] <= cursor]
+        rows = rows[sum(1 for row in rows[:skip] if row[key] == cursor) :]
+    elif cursor:
+        rows = [row for row in rows if row[key] < cursor]
+    if limit is None or len(rows) <= limit:
+        return rows, None
+
+    page = rows[:limit]
+    last_key = page[-1][key]
+    if rows[limit][key] != last_key:
+        return page, last_key
+    tied = sum(1 for row in page if row[key] == last_key) + (skip if last_key == cursor else 0)
+    return page, f"{last_key}#{tied}"
+
+
+def preferred_encoding():
+    """Pick the response encoding the client accepts: zstd (when available), then gzip, else None for identity."""
+    if zstd is not None and request.accept_encodings["zstd"]:
+        return "zstd"
+    if request.accept_encodings["gzip"]:
+        return "gzip"
+    return None
+
+
+def compress_body(body, encoding):
+    """Compress encoded response bytes for the given content encoding."""
+    if encoding == "zstd":
+        return zstd.compress(body)
+    if encoding == "gzip":
+        # mtime=0 keeps the gzip header, and so the ETag, the same for identical bodies
+        return gzip.compress(body, compresslevel=6, mtime=0)
+    return body
+
+
+def conditional_response(body, mimetype, encoded=None):
+    """Build a compressed response from encoded bytes with an ETag, answering matching conditional requests with 304 Not Modified.
+
+    encoded is the per-encoding dict of a response cache entry; compressed bytes and their ETag are stored there on
+    first use so cache hits and 304s do not compress the body again.
+    """
+    encoding = preferred_encoding()
+    compressed = encoded.get(encoding) if encoded is not None else None
+    if compressed is None:
+        data = compress_body(body, encoding)
+        compressed = (data, generate_etag(data))
+        if encoded is not None:
+            encoded[encoding] = compressed
+
+    data, etag = compressed
+    response = app.response_class(data, mimetype=mimetype)
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+
+def json_response(body, encoded=None):
+    """Build a compressed, conditional JSON response from encoded bytes."""
+    return conditional_response(body, "application/json", encoded)
+
+
+def get_cached_response(key):
+    """Get (body, encoded) for a response from the in-memory cache if it is still fresh, else None."""
+    with _response_cache_lock:
+        entry = _response_cache.get(key)
+    if entry and time.monotonic() - entry[0] < RESPONSE_CACHE_TTL:
+        return entry[1], entry[2]
+    return None
+
+
+def cache_response(key, data):
+    """Encode response data as JSON once and keep the bytes in the in-memory cache, returning (body, encoded)."""
+    return cache_body(key, jsonify(data).get_data())
+
+
+def cache_body(key, body):
+    """Keep encoded response bytes in the in-memory cache, returning (body, encoded).
+
+    encoded starts empty and is filled with compressed variants by conditional_response.
+    """
+    encoded = {}
+    with _response_cache_lock:
+        _response_cache.pop(key, None)
+        if len(_response_cache) >= RESPONSE_CACHE_SIZE:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _response_cache[next(iter(_response_cache))]
+        _response_cache[key] = (time.monotonic(), body, encoded)
+    return body, encoded
+
+
 @app.route("/")
 def index():
     """API documentation endpoint."""
@@ -411,6 +749,9 @@ def index():
                     "method": "GET",
                     "parameters": {
                         "months": "Number of months to fetch (default: 2)",
+                        "limit": "Maximum number of days to return, at least 1 (optional)",
+                        "cursor": "Only return days before this date, e.g. next_cursor from the previous page (optional)",
+                        "format": "human (default) for formatted durations, or raw for seconds",
                     },
                     "description": "Get daily health summaries for specified period",
                 },
@@ -418,6 +759,9 @@ def index():
                     "method": "GET",
                     "parameters": {
                         "months": "Number of months to fetch (default: 2)",
+                        "limit": "Maximum number of activities to return, at least 1 (optional)",
+                        "cursor": "Only return activities starting before this date/datetime, or next_cursor from the previous page passed back unchanged (optional)",
+                        "format": "human (default) for formatted durations and distances, or raw for seconds and meters",
                     },
                     "description": "Get activities for specified period",
                 },
@@ -431,6 +775,16 @@ def api_summary():
     """Get daily health summaries for specified period."""
     # Get months parameter (default: 2)
     months = request.args.get("months", default=2, type=int)
+    # Optional keyset pagination: at most `limit` rows older than `cursor`
+    limit = request.args.get("limit", type=int)
+    cursor = request.args.get("cursor")
+    # "raw" skips duration/distance formatting and returns seconds and meters
+    output_format = request.args.get("format", default="human")
+    if output_format not in OUTPUT_FORMATS:
+        return jsonify({"error": "format must be 'human' or 'raw'"}), 400
+    if limit is not None and limit < 1:
+        return jsonify({"error": "limit must be at least 1"}), 400
+    cache_key = ("summary", months, cursor, limit, output_format)
 
     # Calculate date range - include today
     end_date = datetime.now()
@@ -442,48 +796,66 @@ def api_summary():
     print(f"Fetching summaries from {start_date_str} to {end_date_str}...")
 
     try:
-        # Try to load from cache
-        cached_data = load_cache("summary", months)
-
-        if cached_data:
-            print(f"✓ Loaded summaries from cache (summary-last-{months}-months.json)")
-            return jsonify(cached_data)
-
-        # Generate all dates in range
-        all_dates = []
-        current = end_date
-        while current >= start_date:
-            all_dates.append(current.strftime("%Y-%m-%d"))
-            current -= timedelta(days=1)
-
-        # Fetch daily summaries from Garmin
-        print(f"Fetching {len(all_dates)} days from Garmin Connect...")
-        client = get_garmin_client()
-
-        daily_summaries = []
-        for date_str in tqdm(all_dates, desc="Daily summaries", unit="day"):
-            summary = fetch_daily_summary(client, date_str)
-            daily_summaries.append(summary)
-
-        # Fetch activities and count per date
-        print("Fetching activities to count per day...")
-        activities = fetch_activities(client, start_date_str, end_date_str)
-        activity_counts = count_activities_by_date(activities)
-
-        # Add activity counts to summaries
+        # Serve repeated requests straight from memory
+        cached_response = get_cached_response(cache_key)
+        if cached_response:
+            print("✓ Loaded summaries from memory cache")
+            return json_response(*cached_response)
+
+        all_dates = get_all_dates(start_date, end_date)
+
+        # Load cached days and work out which ones still need fetching
+        summaries_by_date = load_cache("summary", all_dates)
+        activities_by_date = load_cache("activities", all_dates)
+        summary_dates = get_dates_to_fetch(all_dates, summaries_by_date)
+        activity_dates = get_dates_to_fetch(all_dates, activities_by_date)
+        incomplete = False
+        print(f"✓ Loaded {len(summaries_by_date)} of {len(all_dates)} days from cache")
+
+        if summary_dates or activity_dates:
+            # Fetch daily summaries from Garmin, overlapping the activity query with the day fetches
+            print(f"Fetching {len(summary_dates)} days and activities from Garmin Connect...")
+            client = get_garmin_client()
+
+            # Body Battery has a range endpoint; days missing from it fall back to per-day requests
+            body_battery_by_date = fetch_body_battery_range(client, min(summary_dates), max(summary_dates)) if summary_dates else {}
+
+            with ThreadPoolExecutor(max_workers=MAX_WORKERS + 1) as executor:
+                activities_future = executor.submit(fetch_activities_by_date, client, activity_dates) if activity_dates else None
+                fetched_summaries, failed_dates = fetch_daily_summaries(executor, client, summary_dates, body_battery_by_date)
+                fetched_activities = activities_future.result() if activities_future else {}
+
+            # Save to cache, keeping cached values for fields a refetch did not return; days where a request
+            # failed are not cached so the next request fetches them again
+            fetched_summaries = {date_str: merge_daily_summary(summary, summaries_by_date.get(date_str)) for date_str, summary in fetched_summaries.items()}
+            save_cache("summary", {date_str: summary for date_str, summary in fetched_summaries.items() if date_str not in failed_dates}, summaries_by_date)
+            save_cache("activities", fetched_activities, activities_by_date)
+            summaries_by_date.update(fetched_summaries)
+            activities_by_date.update(fetched_activities)
+            print(f"✓ Cached {len(fetched_summaries) - len(failed_dates)} days to {os.path.join(CACHE_DIR, 'summary')}")
+            if failed_dates:
+                print(f"Warning: {len(failed_dates)} days had failed requests and were not cached")
+
+            # Partial results are returned but not kept in the memory cache
+            incomplete = bool(failed_dates) or bool(activity_dates and not fetched_activities)
+
+        # Keep newest-first ordering, paginate, and add activity counts to summaries
+        daily_summaries = [summaries_by_date[date_str] for date_str in all_dates if date_str in summaries_by_date]
+        daily_summaries, next_cursor = paginate(daily_summaries, "date", cursor, limit)
         for summary in daily_summaries:
-            summary["num_activities"] = activity_counts.get(summary["date"], 0)
+            summary["num_activities"] = len(activities_by_date.get(summary["date"], []))
 
         # Prepare response data
         response_data = {
-            "summaries": format_summaries_for_output(daily_summaries),
+            # Rows are already written to the day cache, so they can be formatted in place
+            "summaries": format_summaries_for_output(daily_summaries, mutate=True) if output_format == "human" else daily_summaries,
         }
+        if limit is not None or cursor:
+            response_data["next_cursor"] = next_cursor
 
-        # Save to cache
-        save_cache("summary", months, response_data)
-        print(f"✓ Summaries cached to summary-last-{months}-months.json")
-
-        return jsonify(response_data)
+        if incomplete:
+            return json_response(jsonify(response_data).get_data())
+        return json_response(*cache_response(cache_key, response_data))
 
     except Exception as e:
         print(f"Error fetching summaries from Garmin: {e}")
@@ -495,6 +867,16 @@ def api_activities():
     """Get activities for specified period."""
     # Get months parameter (default: 2)
     months = request.args.get("months", default=2, type=int)
+    # Optional keyset pagination: at most `limit` rows older than `cursor`
+    limit = request.args.get("limit", type=int)
+    cursor = request.args.get("cursor")
+    # "raw" skips duration/distance formatting and returns seconds and meters
+    output_format = request.args.get("format", default="human")
+    if output_format not in OUTPUT_FORMATS:
+        return jsonify({"error": "format must be 'human' or 'raw'"}), 400
+    if limit is not None and limit < 1:
+        return jsonify({"error": "limit must be at least 1"}), 400
+    cache_key = ("activities", months, cursor, limit, output_format)
 
     # Calculate date range - include today
     end_date = datetime.now()
@@ -506,33 +888,52 @@ def api_activities():
     print(f"Fetching activities from {start_date_str} to {end_date_str}...")
 
     try:
-        # Try to load from cache
-        cached_data = load_cache("activities", months)
+        # Serve repeated requests straight from memory
+        cached_response = get_cached_response(cache_key)
+        if cached_response:
+            print("✓ Loaded activities from memory cache")
+            return json_response(*cached_response)
 
-        if cached_data:
-            print(f"✓ Loaded activities from cache (activities-last-{months}-months.json)")
-            return jsonify(cached_data)
+        all_dates = get_all_dates(start_date, end_date)
 
-        # Fetch activities from Garmin
-        print("Fetching activities from Garmin Connect...")
-        client = get_garmin_client()
+        # Load cached days and fetch only the missing or recent ones from Garmin
+        activities_by_date = load_cache("activities", all_dates)
+        activity_dates = get_dates_to_fetch(all_dates, activities_by_date)
+        incomplete = False
+        print(f"✓ Loaded activities for {len(activities_by_date)} of {len(all_dates)} days from cache")
+
+        if activity_dates:
+            print(f"Fetching activities for {len(activity_dates)} days from Garmin Connect...")
+            client = get_garmin_client()
+            fetched_activities = fetch_activities_by_date(client, activity_dates)
+
+            # Save to cache
+            save_cache("activities", fetched_activities, activities_by_date)
+            activities_by_date.update(fetched_activities)
+            print(f"✓ Cached activities for {len(fetched_activities)} days to {os.path.join(CACHE_DIR, 'activities')}")
 
-        activities = fetch_activities(client, start_date_str, end_date_str)
+            # A failed fetch caches nothing, and its partial response is not kept in the memory cache either
+            incomplete = not fetched_activities
+
+        # Newest first, matching Garmin's ordering
+        activities = [activity for date_str in all_dates for activity in activities_by_date.get(date_str, [])]
+        activities, next_cursor = paginate(activities, "datetime", cursor, limit)
 
         # Prepare response data
         response_data = {
-            "activities": format_activities_for_output(activities),
+            # Rows are already written to the day cache, so they can be formatted in place
+            "activities": format_activities_for_output(activities, mutate=True) if output_format == "human" else activities,
             "hr_zone_percentages": {
                 "garmin": GARMIN_ZONE_RANGES,
                 "olympiatoppen": OLYMPIATOPPEN_ZONE_RANGES,
             },
         }
+        if limit is not None or cursor:
+            response_data["next_cursor"] = next_cursor
 
-        # Save to cache
-        save_cache("activities", months, response_data)
-        print(f"✓ Activities cached to activities-last-{months}-months.json")
-
-        return jsonify(response_data)
+        if incomplete:
+            return json_response(jsonify(response_data).get_data())
+        return json_response(*cache_response(cache_key, response_data))
 
     except Exception as e:
         print(f"Error fetching activities from Garmin: {e}")
@@ -557,14 +958,21 @@ def status():
         # Get today's date
         today = datetime.now().strftime("%Y-%m-%d")
 
+        # Serve browser refreshes from memory instead of refetching today's data
+        cache_key = ("status", today, subjective_energy)
+        cached_response = get_cached_response(cache_key)
+        if cached_response:
+            body, encoded = cached_response
+            return conditional_response(body, "text/html", encoded)
+
         # Fetch today's data from Garmin
         client = get_garmin_client()
-        summary = fetch_daily_summary(client, today)
+        summary, fetch_failed = fetch_daily_summary(client, today)
 
         # Extract metrics
         hrv = summary.get("hrv_overnight_avg")
         body_battery_values = summary.get("body_battery_values")
-        body_battery_start = max(body_battery_values) if body_battery_values else None
+        body_battery_start = summary.get("body_battery_max")
         body_battery_current = body_battery_values[-1] if body_battery_values else None
         sleep_score = summary.get("sleep_score")
         resting_hr = summary.get("resting_hr")
@@ -600,7 +1008,6 @@ def status():
                 "green": ">75",
                 "yellow": "65-75",
                 "red": "<65",
-
             },
             {
                 "metric": "Body Battery (current)",
@@ -651,282 +1058,29 @@ def status():
                 overall_status = "yellow"
                 recommendation = "Light activity only"
 
-        # Energy level guidance (used in HTML rendering below)
-
-        # Build HTML response
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="UTF-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-            <title>Morning Check - {today}</title>
-            <style>
-                * {{
-                    margin: 0;
-                    padding: 0;
-                    box-sizing: border-box;
-                }}
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Roboto', 'Helvetica', 'Arial', sans-serif;
-                    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-                    min-height: 100vh;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    padding: 20px;
-                }}
-                .container {{
-                    background: white;
-                    border-radius: 20px;
-                    box-shadow: 0 20px 60px rgba(0, 0, 0, 0.3);
-                    max-width: 800px;
-                    width: 100%;
-                    padding: 40px;
-                }}
-                .header {{
-                    text-align: center;
-                    margin-bottom: 30px;
-                }}
-                .header h1 {{
-                    font-size: 32px;
-                    color: #2d3748;
-                    margin-bottom: 10px;
-                }}
-                .header .date {{
-                    font-size: 18px;
-                    color: #718096;
-                }}
-                .status-banner {{
-                    text-align: center;
-                    padding: 20px;
-                    border-radius: 12px;
-                    margin-bottom: 30px;
-                    font-size: 24px;
-                    font-weight: bold;
-                }}
-                .status-green {{ background: #c6f6d5; color: #22543d; }}
-                .status-yellow {{ background: #fefcbf; color: #744210; }}
-                .status-red {{ background: #fed7d7; color: #742a2a; }}
-                .status-unknown {{ background: #e2e8f0; color: #2d3748; }}
-                .metrics-table {{
-                    width: 100%;
-                    border-collapse: collapse;
-                    margin-bottom: 30px;
-                }}
-                .metrics-table th {{
-                    background: #f7fafc;
-                    padding: 12px;
-                    text-align: left;
-                    font-weight: 600;
-                    color: #2d3748;
-                    border-bottom: 2px solid #e2e8f0;
-                }}
-                .metrics-table td {{
-                    padding: 12px;
-                    border-bottom: 1px solid #e2e8f0;
-                }}
-                .metrics-table tr:last-child td {{
-                    border-bottom: none;
-                }}
-                .metric-name {{
-                    font-weight: 500;
-                    color: #2d3748;
-                }}
-                .metric-value {{
-                    font-size: 18px;
-                    font-weight: 600;
-                }}
-                .status-indicator {{
-                    display: inline-block;
-                    width: 12px;
-                    height: 12px;
-                    border-radius: 50%;
-                    margin-right: 8px;
-                }}
-                .indicator-green {{ background: #48bb78; }}
-                .indicator-yellow {{ background: #ecc94b; }}
-                .indicator-red {{ background: #f56565; }}
-                .indicator-none {{ background: #cbd5e0; }}
-                .threshold {{
-                    font-size: 12px;
-                    color: #718096;
-                }}
-                .threshold-cell {{
-                    text-align: center;
-                    font-size: 11px;
-                    color: #718096;
-                }}
-                .energy-guidance {{
-                    background: #ebf8ff;
-                    border-left: 4px solid #4299e1;
-                    padding: 20px;
-                    border-radius: 8px;
-                    margin-top: 20px;
-                }}
-                .energy-guidance h3 {{
-                    color: #2c5282;
-                    margin-bottom: 12px;
-                    font-size: 18px;
-                }}
-                .energy-guidance p {{
-                    color: #2d3748;
-                    margin-bottom: 8px;
-                    line-height: 1.6;
-                }}
-                .energy-zones {{
-                    display: flex;
-                    gap: 15px;
-                    margin-top: 15px;
-                }}
-                .zone {{
-                    flex: 1;
-                    padding: 10px;
-                    border-radius: 8px;
-                    text-align: center;
-                    font-size: 14px;
-                }}
-                .zone-green {{ background: #c6f6d5; color: #22543d; }}
-                .zone-yellow {{ background: #fefcbf; color: #744210; }}
-                .zone-red {{ background: #fed7d7; color: #742a2a; }}
-            </style>
-        </head>
-        <body>
-            <div class="container">
-                <div class="header">
-                    <h1>🌅 Morning Check</h1>
-                    <div class="date">{today}</div>
-                </div>
-
-                <div class="status-banner status-{overall_status}">
-                    {recommendation}
-                </div>
-
-                <table class="metrics-table">
-                    <thead>
-                        <tr>
-                            <th>Metric</th>
-                            <th>Current Value</th>
-                            <th class="threshold-cell">🟢 Green</th>
-                            <th class="threshold-cell">🟡 Yellow</th>
-                            <th class="threshold-cell">🔴 Red</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-        """
-
-        # Add metrics rows
-        for metric in metrics_table:
-            status_class = "none" if metric["status"] is None else metric["status"]
-            indicator_class = f"indicator-{status_class}"
-            value_display = f"{metric['current_value']} {metric['unit']}" if metric["current_value"] is not None else "N/A"
-
-            html += f"""
-                        <tr>
-                            <td class="metric-name">
-                                <span class="status-indicator {indicator_class}"></span>
-                                {metric["metric"]}
-                            </td>
-                            <td class="metric-value">{value_display}</td>
-                            <td class="threshold-cell">{metric["green"]}</td>
-                            <td class="threshold-cell">{metric["yellow"]}</td>
-                            <td class="threshold-cell">{metric["red"]}</td>
-                        </tr>
-            """
-
-        html += """
-                    </tbody>
-                </table>
-        """
-
-        # Add energy guidance
-        if subjective_energy is not None:
-            energy_zone = energy_zones.get(subjective_energy, "red")
-            zone_emoji = "🟢" if energy_zone == "green" else "🟡" if energy_zone == "yellow" else "🔴"
-            html += f"""
-                <div class="energy-guidance">
-                    <h3>{zone_emoji} Energy Level Assessment</h3>
-                    <p><strong>Your energy level:</strong> {subjective_energy}/10</p>
-                    <p>With your energy level of {subjective_energy}/10, you are in the <strong>{energy_zone}</strong> zone.</p>
-                </div>
-            """
-        else:
-            html += """
-                <div class="energy-guidance">
-                    <h3>❓ What is your energy level today?</h3>
-                    <p>Add your subjective energy level (1-10) to see your personalized recommendation:</p>
-                    <div class="energy-zones">
-                        <div class="zone zone-green">
-                            <strong>🟢 Green</strong><br>
-                            7-10/10
-                        </div>
-                        <div class="zone zone-yellow">
-                            <strong>🟡 Yellow</strong><br>
-                            5-6/10
-                        </div>
-                        <div class="zone zone-red">
-                            <strong>🔴 Red</strong><br>
-                            1-4/10
-                        </div>
-                    </div>
-                    <p style="margin-top: 15px; font-size: 13px; color: #718096;">
-                        Add <code>?energy=7</code> to the URL to include your energy level.
-                    </p>
-                </div>
-            """
-
-        html += """
-            </div>
-        </body>
-        </html>
-        """
-
-        return html
+        # Energy level guidance
+        energy_zone = energy_zones.get(subjective_energy, "red")
+        zone_emoji = "🟢" if energy_zone == "green" else "🟡" if energy_zone == "yellow" else "🔴"
+
+        html = render_template(
+            "status.html",
+            today=today,
+            overall_status=overall_status,
+            recommendation=recommendation,
+            metrics=metrics_table,
+            subjective_energy=subjective_energy,
+            energy_zone=energy_zone,
+            zone_emoji=zone_emoji,
+        )
+        # Only cache complete pages; before the watch syncs, or after a failed request, the next refresh refetches
+        if fetch_failed or all(metric["current_value"] is None for metric in metrics_table):
+            return conditional_response(html.encode(), "text/html")
+        body, encoded = cache_body(cache_key, html.encode())
+        return conditional_response(body, "text/html", encoded)
 
     except Exception as e:
         print(f"Error fetching status from Garmin: {e}")
-        return (
-            f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Error</title>
-            <style>
-                body {{
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-                    background: #f7fafc;
-                    display: flex;
-                    justify-content: center;
-                    align-items: center;
-                    min-height: 100vh;
-                    padding: 20px;
-                }}
-                .error {{
-                    background: white;
-                    padding: 40px;
-                    border-radius: 12px;
-                    box-shadow: 0 4px 6px rgba(0,0,0,0.1);
-                    max-width: 500px;
-                }}
-                .error h1 {{
-                    color: #e53e3e;
-                    margin-bottom: 16px;
-                }}
-                .error p {{
-                    color: #4a5568;
-                }}
-            </style>
-        </head>
-        <body>
-            <div class="error">
-                <h1>⚠️ Error</h1>
-                <p>{str(e)}</p>
-            </div>
-        </body>
-        </html>
-        """,
-            500,
-        )
+        return render_template("error.html", error=str(e)), 500
 
 
 if __name__ == "__main__":
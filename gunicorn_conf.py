@@ -0,0 +1,15 @@
+"""
+Gunicorn configuration for serving the Garmin Connect Log API
+Run with: uv run --with gunicorn gunicorn -c gunicorn_conf.py app:app
+"""
+
+bind = "127.0.0.1:5000"
+
+# Threaded workers let cache hits be served while a long Garmin fetch is running
+workers = 2
+threads = 8
+worker_class = "gthread"
+keepalive = 30
+
+# A cold multi-month fetch from Garmin can take several minutes (keep STALE_CACHE_TMP_AGE in app.py at least this long)
+timeout = 600
@@ -5,6 +5,7 @@ Authenticates with Garmin Connect and saves session token to .env file
 """
 
 import os
+from datetime import datetime
 from getpass import getpass
 
 from garminconnect import Garmin
@@ -35,7 +36,7 @@ def setup_oauth():
 
         with open(env_path, "w") as f:
             f.write("# Garmin Connect OAuth session token\n")
-            f.write(f"# Generated: {os.popen('date').read().strip()}\n")
+            f.write(f"# Generated: {datetime.now().isoformat(timespec='seconds')}\n")
             f.write(f"GARMIN_SESSION={session_token}\n")
 
         print("\n✓ Authentication successful!")